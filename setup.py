@@ -12,6 +12,7 @@ setup(
         "langgraph",
         "python-dotenv",
         "requests",
+        "orjson",
         "pydantic",
         "dateparser"
     ],
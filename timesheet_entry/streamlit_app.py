@@ -7,30 +7,109 @@
 import os, sys
 import streamlit as st
 from datetime import datetime
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
 from langchain_core.messages import BaseMessage
-from langgraph.prebuilt import create_react_agent
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 # Add current directory to Python path so local modules can be imported
 sys.path.append(os.getcwd())
 
-# Import your custom tool to log time to Jira Tempo
-from timesheet_tool import LogTimeToTempoTool
+# Most distinct prompts kept in the process-wide LLM cache before the oldest are evicted
+LLM_CACHE_SIZE = 256
 
-# Initialize the language model with Gemini 2.5 Flash variant and moderate temperature for response variability
-model = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0.3)
+# Heavy LLM, agent and tool modules are imported inside the cached factories below,
+# so the first page render does not wait on them
 
-# Initialize the time-logging tool with credentials and Jira domain read from environment variables
-tool_instance = LogTimeToTempoTool(
-    jira_email=os.environ.get("JIRA_EMAIL"),
-    jira_token=os.environ.get("JIRA_TOKEN"),
-    tempo_token=os.environ.get("TEMPO_TOKEN"),
-    jira_domain=os.environ.get("JIRA_DOMAIN").rstrip('/')
-)
-tools = [tool_instance]
+@st.cache_resource
+def get_model():
+    """
+    Build the Gemini chat model once per process so Streamlit reruns reuse it.
+    """
+    # Answer repeated identical prompts from memory instead of another Gemini round-trip.
+    # Bounded, since every session served by this process shares the cache. The system prompt
+    # carries today's date, so a cached plan is never replayed on a later day
+    set_llm_cache(InMemoryCache(maxsize=LLM_CACHE_SIZE))
+
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from timesheet_tool import bootstrap_env
+
+    # Load .env (and prompt for a missing GOOGLE_API_KEY) before the model reads it
+    bootstrap_env()
+
+    # Initialize the language model with Gemini 2.5 Flash variant and moderate temperature for response variability
+    return ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0.3)
+
+
+def get_tool_credentials() -> dict:
+    """
+    Read the Jira and Tempo credentials shared by the time-logging tools from environment variables.
+    """
+    from timesheet_tool import bootstrap_env
+
+    # Load .env (and prompt for missing values) before reading the credentials
+    bootstrap_env()
+
+    return dict(
+        jira_email=os.environ.get("JIRA_EMAIL"),
+        jira_token=os.environ.get("JIRA_TOKEN"),
+        tempo_token=os.environ.get("TEMPO_TOKEN"),
+        jira_domain=os.environ.get("JIRA_DOMAIN").rstrip('/')
+    )
+
+
+@st.cache_resource
+def get_tool():
+    """
+    Build the Tempo time-logging tool once per process so Streamlit reruns reuse it.
+    """
+    # Import your custom tool to log time to Jira Tempo
+    from timesheet_tool import LogTimeToTempoTool
+
+    # Initialize the time-logging tool with credentials and Jira domain read from environment variables
+    return LogTimeToTempoTool(**get_tool_credentials())
+
+
+@st.cache_resource
+def get_bulk_tool():
+    """
+    Build the batch time-logging tool once per process so Streamlit reruns reuse it.
+    """
+    from timesheet_tool import BulkLogTimeToTempoTool
+
+    # Wrap the single-worklog tool so both share one HTTP session and account ID cache
+    return BulkLogTimeToTempoTool(tempo_tool=get_tool())
+
+
+@st.cache_resource
+def get_agent():
+    """
+    Create the ReAct agent that binds the LLM with the tools, once per process.
+    """
+    from langgraph.prebuilt import create_react_agent
+
+    return create_react_agent(get_model(), [get_tool(), get_bulk_tool()])
+
+
+def render_message(msg: BaseMessage):
+    """
+    Display a single agent message (AI reply, tool call or tool result) in the Streamlit UI.
+    """
+    st.write(f"[{msg.type.upper()}] {msg.content}")
+
+    # Special handling for tool messages
+    if msg.type == "tool":
+        # Handle tool message
+        st.write(f"Tool message from: {getattr(msg, 'name', 'unknown')} — {msg.content}")
+
+    # Handling AI messages which may include tool calls or plain text response
+    elif msg.type == "ai":
+        # Might have tool_calls or response text
+        tool_calls = getattr(msg, "tool_calls", [])
+        if tool_calls:
+            st.write(f"Tool calls: {tool_calls}")
+        else:
+            st.write(f"Final AI Response: {msg.content}")
 
-# Create an agent that binds the LLM with the tools for reactive interaction
-agent_executor = create_react_agent(model, tools)
 
 # Streamlit UI setup: page title and layout
 st.set_page_config(page_title="Jira Time Tracker", layout="centered")
@@ -50,8 +129,13 @@ if st.button("Log Time") and user_input.strip():
                 "role": "system",
                 "content": (
                     "You are a time-tracking assistant that updates Jira issues using provided tools. "
+                    f"Today's date is {datetime.today().date().isoformat()}. "
                     "If the user does not specify an issue key, assume the issue key is 'MGAP-X'. "
                     "Do not ask the user for clarification or confirmation — just proceed with the default value. "
+                    "To log one issue over a named range such as 'this week' or 'last week', make a single "
+                    "log_time_to_tempo call with date_range. "
+                    "When logging several issues, or days that no single date_range covers, emit a single "
+                    "bulk_log_time_to_tempo call containing all entries. "
                     "Only respond with the result or tool call."
                 )
             },
@@ -59,29 +143,25 @@ if st.button("Log Time") and user_input.strip():
         ]
 
         try:
-            # Invoke the agent with the prepared messages and get response
-            response = agent_executor.invoke({"messages": messages})
-
-            # Process and display assistant messages returned by the agent
-            if "messages" in response:
-                for msg in response["messages"]:
-                    if isinstance(msg, BaseMessage):
-                        st.write(f"[{msg.type.upper()}] {msg.content}")
-
-                        # Special handling for tool messages
-                        if msg.type == "tool":
-                            # Handle tool message
-                            st.write(f"Tool message from: {getattr(msg, 'name', 'unknown')} — {msg.content}")
-
-                        # Handling AI messages which may include tool calls or plain text response
-                        elif msg.type == "ai":
-                            # Might have tool_calls or response text
-                            tool_calls = getattr(msg, "tool_calls", [])
-                            if tool_calls:
-                                st.write(f"Tool calls: {tool_calls}")
-                            else:
-                                st.write(f"Final AI Response: {msg.content}")
-            else:
+            # Reuse the agent across reruns of this session
+            if "agent" not in st.session_state:
+                st.session_state["agent"] = get_agent()
+            agent_executor = st.session_state["agent"]
+
+            from timesheet_tool import worklog_run
+
+            # Stream the agent run so each LLM step and tool result is shown as soon as it completes.
+            # worklog_run() keeps a worklog the agent repeats across tool calls from being posted twice
+            received = False
+            with worklog_run():
+                for event in agent_executor.stream({"messages": messages}, stream_mode="updates"):
+                    for update in event.values():
+                        for msg in (update or {}).get("messages", []):
+                            if isinstance(msg, BaseMessage):
+                                received = True
+                                render_message(msg)
+
+            if not received:
                 # Warn user if no messages are returned from the agent
                 st.warning("No messages returned.")
 
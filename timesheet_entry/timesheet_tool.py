@@ -5,14 +5,19 @@
 
 
 import os                         # For accessing environment variables
+import contextlib                 # For scoping duplicate-worklog tracking to one agent invocation
+import functools                  # For running the environment bootstrap only once
 import getpass                    # (Optional) For secure password input in interactive sessions
+import orjson                     # Fast JSON encoding/decoding for API payloads and responses
 import requests                   # For making HTTP requests (e.g., to APIs)
-from typing import List, Optional       # For optional type hints
+import threading                  # For guarding state shared by worker threads
+import uuid                       # For per-request idempotency keys on worklog POSTs
+from concurrent.futures import ThreadPoolExecutor  # For posting independent worklogs concurrently
+from contextvars import ContextVar, copy_context   # Carries the current agent invocation into worker threads
+from requests.adapters import HTTPAdapter  # Connection pooling for the shared HTTP session
+from urllib3.util.retry import Retry       # Retry policy for transient HTTP failures
+from typing import List, Optional, Tuple, Type # For optional type hints
 from datetime import datetime, timedelta
-import dateparser
-
-# Load environment variables from a .env file
-from dotenv import load_dotenv
 
 # LangChain tool base classes for defining custom tools
 from langchain.tools import Tool, BaseTool
@@ -21,31 +26,115 @@ from langchain.tools import Tool, BaseTool
 from langchain.callbacks.manager import CallbackManagerForToolRun
 
 # Used to define structured inputs and validation for tools
-from pydantic import Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 # In[8]:
 
 
-# Load environment variables from .env file
-load_dotenv()
+@functools.cache
+def bootstrap_env():
+    """
+    Load environment variables from a .env file and prompt for any missing API keys.
 
-# Setup API Keys
-if not os.environ.get("GOOGLE_API_KEY"):
-  os.environ["GOOGLE_API_KEY"] = getpass.getpass("Enter API key for Google Gemini: ")
-if not os.environ.get("JIRA_DOMAIN"):
-  os.environ["JIRA_DOMAIN"] = getpass.getpass("Enter JIRA domain: ")
-if not os.environ.get("JIRA_EMAIL"):
-  os.environ["JIRA_EMAIL"] = getpass.getpass("Enter JIRA email: ")
-if not os.environ.get("JIRA_TOKEN"):
-  os.environ["JIRA_TOKEN"] = getpass.getpass("Enter JIRA token: ")
-if not os.environ.get("TEMPO_TOKEN"):
-  os.environ["TEMPO_TOKEN"] = getpass.getpass("Enter TEMPO token: ")
+    Runs once per process, and must be called before reading credentials from os.environ
+    to build a tool or model; importing this module no longer does it.
+    """
+    # Load environment variables from .env file
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    # Setup API Keys
+    if not os.environ.get("GOOGLE_API_KEY"):
+      os.environ["GOOGLE_API_KEY"] = getpass.getpass("Enter API key for Google Gemini: ")
+    if not os.environ.get("JIRA_DOMAIN"):
+      os.environ["JIRA_DOMAIN"] = getpass.getpass("Enter JIRA domain: ")
+    if not os.environ.get("JIRA_EMAIL"):
+      os.environ["JIRA_EMAIL"] = getpass.getpass("Enter JIRA email: ")
+    if not os.environ.get("JIRA_TOKEN"):
+      os.environ["JIRA_TOKEN"] = getpass.getpass("Enter JIRA token: ")
+    if not os.environ.get("TEMPO_TOKEN"):
+      os.environ["TEMPO_TOKEN"] = getpass.getpass("Enter TEMPO token: ")
 
 
 # In[9]:
 
 
+# Day offsets from this week's Monday for the named week ranges understood by resolve_dates
+WEEK_OFFSETS = {
+    "this week": 0,
+    "full week": 0,
+    "next week": 7,
+    "last week": -7,
+}
+
+# In-progress issues that auto mode splits time across, the most issues fetched per search page,
+# and the most pages followed before the list is reported as truncated
+IN_PROGRESS_JQL = 'assignee=currentUser() AND project=MGAP AND statusCategory="In Progress"'
+MAX_SEARCH_RESULTS = 50
+MAX_SEARCH_PAGES = 4
+TRUNCATED_NOTE = f"Note: only the first {MAX_SEARCH_RESULTS * MAX_SEARCH_PAGES} in-progress issues were used; the list was truncated."
+
+# Dates logged concurrently by _run, and worklogs posted concurrently per date. Their product is the
+# most requests in flight at once, so the HTTP connection pool is sized to match
+MAX_DATE_WORKERS = 5
+MAX_ISSUE_WORKERS = 8
+
+# Worklogs posted during the current agent invocation, or None outside worklog_run()
+_posted_worklogs: ContextVar[Optional[set]] = ContextVar("posted_worklogs", default=None)
+_posted_worklogs_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def worklog_run():
+    """
+    Scope duplicate-worklog detection to one agent invocation.
+
+    Every tool call made inside the block, including parallel ones, shares one record of
+    posted worklogs, so a worklog the agent repeats is only posted once. Each invocation
+    gets its own record even though the tool instance is shared across Streamlit sessions.
+
+    Nested blocks reuse the outer record, so the tools can open one per call and still
+    defer to the invocation-wide scope when the caller has set one up.
+    """
+    if _posted_worklogs.get() is not None:
+        yield
+        return
+    token = _posted_worklogs.set(set())
+    try:
+        yield
+    finally:
+        _posted_worklogs.reset(token)
+
+
+def parse_date(value: str) -> Optional[datetime]:
+    """
+    Parse a date string, trying the ISO 'YYYY-MM-DD' form first and falling back to dateparser.
+
+    dateparser is imported lazily so callers that only ever pass ISO dates never pay its import cost.
+    """
+    try:
+        return datetime.fromisoformat(value.strip())
+    except ValueError:
+        import dateparser
+        return dateparser.parse(value)
+
+
+class WorklogRetry(Retry):
+    """
+    urllib3 retry policy for the shared session.
+
+    GETs are retried on the usual rate-limit and gateway statuses. Tempo does not document
+    idempotent POSTs, so a POST is only retried when the server refused it before doing any
+    work: on 429, or on 503 with a Retry-After header. A 502/504 may arrive after the worklog
+    was already saved, so retrying it could log the time twice.
+    """
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return bool(self.total) and (status_code == 429 or (status_code == 503 and has_retry_after))
+        return super().is_retry(method, status_code, has_retry_after)
+
+
 class LogTimeToTempoTool(BaseTool):
     """
     A LangChain-compatible tool for logging work hours to Tempo Timesheets 
@@ -80,14 +169,32 @@ class LogTimeToTempoTool(BaseTool):
     get_account_id() -> str
         Retrieves the Jira account ID for the currently authenticated user.
 
+    get_issue_id(issue_key) -> str
+        Retrieves (and caches) the internal JIRA issue ID for an issue key.
+
     log_manual(issue_key, time_seconds, work_date, account_id, work_start="09:00:00", description="work") -> str
         Logs a specific number of seconds to a given Jira issue for a given date and time.
 
-    log_auto_for_date(work_date, account_id, total_hours, work_start="09:00:00", description="work") -> str
+    fetch_in_progress_issues() -> Tuple[List[dict], bool]
+        Searches JIRA (/rest/api/3/search/jql) for the user's in-progress issues, following up to MAX_SEARCH_PAGES
+        pages of MAX_SEARCH_RESULTS. Also returns whether more issues remained unfetched (the list was truncated).
+
+    log_auto_for_date(work_date, account_id, total_hours, work_start="09:00:00", description="work", issues=None) -> str
         Distributes total work hours evenly across all in-progress Jira issues for a given date.
+        Pass issues to reuse a search already made for this run.
+
+    split_worklogs(issues, work_date, account_id, total_hours, work_start="09:00:00", description="work") -> list
+        Splits total work hours across issues, returning the post_worklog arguments for each issue.
+
+    claim_worklog(issue_key, time_seconds, work_date, work_start) -> bool
+        Marks a worklog as posted for the current worklog_run(), returning False if it is a duplicate.
+
+    release_worklog(issue_key, time_seconds, work_date, work_start)
+        Drops the claim on a worklog whose POST failed, so it can be retried.
 
     post_worklog(issue_key, issue_id, time_seconds, work_date, work_start, description, account_id) -> str
         Posts a single worklog entry to the Tempo API with the specified parameters.
+        Identical worklogs repeated within one agent invocation (see worklog_run) are skipped rather than posted twice.
 
 
     Returns:
@@ -115,6 +222,33 @@ class LogTimeToTempoTool(BaseTool):
     tempo_token: str = Field(..., description="Tempo API token")
     jira_domain: str = Field(..., description="JIRA domain, e.g., your-domain.atlassian.net")
 
+    # Shared HTTP session so JIRA and Tempo connections are kept alive between calls
+    _session: requests.Session = PrivateAttr(default=None)
+
+    # Values that never change for these credentials, fetched once and reused
+    _account_id: Optional[str] = PrivateAttr(default=None)
+    _issue_ids: dict = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context) -> None:
+        super().model_post_init(__context)
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=MAX_DATE_WORKERS * MAX_ISSUE_WORKERS,
+            # Back off on rate limits and transient gateway errors, honouring Tempo/JIRA's Retry-After header.
+            # POSTs are retried only on 429/503; see WorklogRetry
+            max_retries=WorklogRetry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                respect_retry_after_header=True,
+                raise_on_status=False  # Hand the last response back so callers report it as usual
+            )
+        )
+        session.mount("https://", adapter)
+        session.headers.update({"Accept": "application/json"})
+        self._session = session
+
 
     def _run(
         self,
@@ -128,151 +262,203 @@ class LogTimeToTempoTool(BaseTool):
     ) -> str:
         print(f"LLM input: work_date={work_date}, date_range={date_range}")
 
-        try:
-            # Step 1: Resolve work dates
-            dates_to_log = self.resolve_dates(work_date, date_range)
-
-            # Step 2: Get account ID (once)
-            account_id = self.get_account_id()
-
-            # Step 3: Mode handling (auto or manual)
-            results = []
-            for date in dates_to_log:
-                if issue_key != "MGAP-X":
-                    print("In manual mode...")
-                    print("Values:", issue_key, time_seconds, date, work_start, description, account_id)
-                    result = self.log_manual(issue_key, 
-                                             time_seconds, 
-                                             date, 
-                                             account_id,
-                                             work_start, 
-                                             description)
+        # Track duplicates for this call, unless an enclosing worklog_run() already covers the invocation
+        with worklog_run():
+            try:
+                # Step 1: Resolve work dates
+                dates_to_log = self.resolve_dates(work_date, date_range)
+
+                # Step 2: Get account ID (once)
+                account_id = self.get_account_id()
+
+                # Step 3: Mode handling (auto or manual)
+                manual_mode = issue_key != "MGAP-X"
+                total_hours = time_seconds / 3600
+                if not manual_mode and not total_hours:
+                    return "total_hours is required in auto_from_jira mode."
+
+                if manual_mode:
+                    # Resolve the issue ID before fanning out, so the date threads all hit the cache
+                    self.get_issue_id(issue_key)
+                    issues, truncated = None, False
                 else:
-                    print("In auto mode...")
-                    print("Values:", date, account_id, time_seconds, work_start, description)
-                    total_hours = time_seconds / 3600
-                    if not total_hours:
-                        return "total_hours is required in auto_from_jira mode."
-                    result = self.log_auto_for_date(date, 
-                                                    account_id, 
-                                                    total_hours,
-                                                    work_start, 
-                                                    description)
-                results.append(f"{date}: {result}")
-
-            return "\n".join(results)
-
-        except Exception as e:
-            return f"Exception occurred: {str(e)}"
+                    # The in-progress issues are the same for every date, so search for them once per run
+                    issues, truncated = self.fetch_in_progress_issues()
+
+                # Step 4: Log every date concurrently, as each date is an independent workflow
+                with ThreadPoolExecutor(max_workers=min(len(dates_to_log), MAX_DATE_WORKERS)) as ex:
+                    futures = {}
+                    for date in dates_to_log:
+                        if manual_mode:
+                            print("In manual mode...")
+                            print("Values:", issue_key, time_seconds, date, work_start, description, account_id)
+                            future = ex.submit(copy_context().run,
+                                               self.log_manual,
+                                               issue_key,
+                                               time_seconds,
+                                               date,
+                                               account_id,
+                                               work_start,
+                                               description)
+                        else:
+                            print("In auto mode...")
+                            print("Values:", date, account_id, time_seconds, work_start, description)
+                            future = ex.submit(copy_context().run,
+                                               self.log_auto_for_date,
+                                               date,
+                                               account_id,
+                                               total_hours,
+                                               work_start,
+                                               description,
+                                               issues)
+                        futures[future] = date
+
+                    # Dicts keep insertion order, so results follow the order of dates_to_log
+                    results = [f"{date}: {future.result()}" for future, date in futures.items()]
+
+                if truncated:
+                    results.append(TRUNCATED_NOTE)
+                return "\n".join(results)
+
+            except Exception as e:
+                return f"Exception occurred: {str(e)}"
 
     # --- Utility Methods ---
 
     def resolve_dates(self, work_date: Optional[str], date_range: Optional[str]) -> List[str]:
         today = datetime.today()
+        monday = today - timedelta(days=today.weekday())
         dates = []
 
         if date_range:
             date_range_lower = date_range.lower().replace("_", " ").strip()
 
-            if date_range_lower in("this_week", "this week"):
-                start = today - timedelta(days=today.weekday())  # Monday
-                for i in range(5):  # Mon to Fri
-                    dates.append((start + timedelta(days=i)).strftime('%Y-%m-%d'))
-
-            elif date_range_lower in("full_week" or "full week"):
-                start = today - timedelta(days=today.weekday())  # Monday
-                for i in range(5):  # Mon–Fri
-                    dates.append((start + timedelta(days=i)).strftime('%Y-%m-%d'))
-
-            elif date_range_lower in("next_week" "next week"):
-                print("Here for next week conversion...")
-                start = today + timedelta(days=(7 - today.weekday()))  # Next Monday
-                print("Start:", start)
-                for i in range(5):  # Mon–Fri next week
-                    dates.append((start + timedelta(days=i)).strftime('%Y-%m-%d'))
-
-            elif date_range_lower in("last_week", "last week"):
-                start = today - timedelta(days=(today.weekday() + 7))  # Previous Monday
-                for i in range(5):  # Mon–Fri last week
-                    dates.append((start + timedelta(days=i)).strftime('%Y-%m-%d'))
+            if date_range_lower in WEEK_OFFSETS:
+                start = monday + timedelta(days=WEEK_OFFSETS[date_range_lower])
+                dates = [(start + timedelta(days=i)).date().isoformat() for i in range(5)]  # Mon–Fri
 
             else:
                 # Try to parse generic natural language date like "next Monday"
-                parsed = dateparser.parse(date_range)
+                parsed = parse_date(date_range)
                 if not parsed:
                     raise ValueError(f"Could not parse date_range: {date_range}")
-                dates = [parsed.strftime('%Y-%m-%d')]
+                dates = [parsed.date().isoformat()]
 
         elif work_date:
-            parsed = dateparser.parse(work_date)
+            parsed = parse_date(work_date)
             if not parsed:
                 raise ValueError(f"Could not parse work_date: {work_date}")
-            dates = [parsed.strftime('%Y-%m-%d')]
+            dates = [parsed.date().isoformat()]
 
         else:
             # Default to today
-            dates = [today.strftime('%Y-%m-%d')]
+            dates = [today.date().isoformat()]
 
         print(dates)
         return dates
 
     def get_account_id(self) -> str:
+        if self._account_id:
+            return self._account_id
         url = f"https://{self.jira_domain}/rest/api/3/myself"
-        response = requests.get(
+        response = self._session.get(
             url,
-            auth=(self.jira_email, self.jira_token),
-            headers={"Accept": "application/json"}
+            auth=(self.jira_email, self.jira_token)
         )
         if response.status_code != 200:
             raise Exception(f"Failed to fetch account info: {response.text}")
-        return response.json()["accountId"]
-
-    def log_manual(self, issue_key, time_seconds, work_date, account_id, work_start: Optional[str]="09:00:00", description: Optional[str] = "work") -> str:
+        self._account_id = orjson.loads(response.content)["accountId"]
+        return self._account_id
+
+    def get_issue_id(self, issue_key) -> str:
+        # Issue IDs never change, so only look each key up once
+        issue_id = self._issue_ids.get(issue_key)
+        if issue_id:
+            return issue_id
         issue_url = f"https://{self.jira_domain}/rest/api/3/issue/{issue_key}"
-        issue_response = requests.get(
+        issue_response = self._session.get(
             issue_url,
-            auth=(self.jira_email, self.jira_token),
-            headers={"Accept": "application/json"}
+            auth=(self.jira_email, self.jira_token)
         )
         if issue_response.status_code != 200:
-            return f"Failed to fetch issue {issue_key}: {issue_response.text}"
-        issue_id = issue_response.json()["id"]
+            raise Exception(f"Failed to fetch issue {issue_key}: {issue_response.text}")
+        issue_id = orjson.loads(issue_response.content)["id"]
+        self._issue_ids[issue_key] = issue_id
+        return issue_id
+
+    def log_manual(self, issue_key, time_seconds, work_date, account_id, work_start: Optional[str]="09:00:00", description: Optional[str] = "work") -> str:
+        try:
+            issue_id = self.get_issue_id(issue_key)
+        except Exception as e:
+            return str(e)
 
         return self.post_worklog(issue_key, issue_id, time_seconds, work_date, work_start, description, account_id)
 
-    def log_auto_for_date(self, work_date, account_id, total_hours, work_start: Optional[str]="09:00:00", description: Optional[str] = "work") -> str:
-        # Fetch in-progress issues
-        jql = 'assignee=currentUser() AND project=MGAP AND statusCategory="In Progress"'
-        search_url = f"https://{self.jira_domain}/rest/api/3/search"
-        search_response = requests.get(
-            search_url,
-            auth=(self.jira_email, self.jira_token),
-            headers={"Accept": "application/json"},
-            params={"jql": jql, "fields": "id,key"}
-        )
-        if search_response.status_code != 200:
-            return f"Failed to fetch in-progress issues: {search_response.text}"
-        issues = search_response.json().get("issues", [])
+    def fetch_in_progress_issues(self) -> Tuple[List[dict], bool]:
+        search_url = f"https://{self.jira_domain}/rest/api/3/search/jql"
+        params = {"jql": IN_PROGRESS_JQL, "fields": "id,key", "maxResults": MAX_SEARCH_RESULTS}
+        issues = []
+        for _ in range(MAX_SEARCH_PAGES):
+            search_response = self._session.get(
+                search_url,
+                auth=(self.jira_email, self.jira_token),
+                params=params
+            )
+            if search_response.status_code != 200:
+                raise Exception(f"Failed to fetch in-progress issues: {search_response.text}")
+            page = orjson.loads(search_response.content)
+            issues.extend(page.get("issues", []))
+
+            # The enhanced search pages with a token rather than startAt; stop once JIRA says this was the last page
+            next_page_token = page.get("nextPageToken")
+            if page.get("isLast", True) or not next_page_token:
+                return issues, False
+            params = {**params, "nextPageToken": next_page_token}
+
+        # Out of pages with more issues still to come
+        return issues, True
+
+    def log_auto_for_date(self, work_date, account_id, total_hours, work_start: Optional[str]="09:00:00", description: Optional[str] = "work", issues: Optional[List[dict]] = None) -> str:
+        # Fetch in-progress issues, unless the caller already fetched them for this run
+        truncated = False
+        if issues is None:
+            issues, truncated = self.fetch_in_progress_issues()
         if not issues:
             return "No in-progress issues found."
 
+        arglist = self.split_worklogs(issues, work_date, account_id, total_hours, work_start, description)
+
+        # Each worklog targets a different issue, so post them concurrently
+        with ThreadPoolExecutor(max_workers=MAX_ISSUE_WORKERS) as ex:
+            futures = [ex.submit(copy_context().run, self.post_worklog, *args) for args in arglist]
+            # Report each issue's own outcome (logged, failed or skipped), in submission order
+            results = [future.result() for future in futures]
+
+        if truncated:
+            results.append(TRUNCATED_NOTE)
+        return " | ".join(results)
+
+    def split_worklogs(self, issues, work_date, account_id, total_hours, work_start: Optional[str]="09:00:00", description: Optional[str] = "work"):
         total_seconds = int(total_hours * 3600)
         base_seconds = total_seconds // len(issues)
         remaining_seconds = total_seconds % len(issues)  # Leftover time to distribute
 
         base_time = datetime.strptime(work_start, "%H:%M:%S")
 
-        results = []
+        # Compute every issue's start time up front, back to back from work_start
+        start_times = [
+            (base_time + timedelta(seconds=i * base_seconds)).time().isoformat(timespec="seconds")
+            for i in range(len(issues))
+        ]
+
+        arglist = []
         for i, issue in enumerate(issues):
             # Distribute extra seconds to avoid truncation loss
             extra = 1 if i < remaining_seconds else 0
             time_for_this_issue = base_seconds + extra
+            issue_start_str = start_times[i]
 
-            # Compute start time for this issue
-            issue_start_time = base_time + timedelta(seconds=i * base_seconds)
-            issue_start_str = issue_start_time.strftime("%H:%M:%S")
-
-            result = self.post_worklog(
+            arglist.append((
                 issue["key"],
                 issue["id"],
                 time_for_this_issue,
@@ -280,12 +466,32 @@ class LogTimeToTempoTool(BaseTool):
                 issue_start_str,  # New start time for each issue
                 description,
                 account_id
-            )
-            logged_hours = round(time_for_this_issue / 3600, 2)
-            results.append(f"{issue['key']}: {logged_hours}h at {issue_start_str}")
-        return " | ".join(results)
+            ))
+        return arglist
+
+    def claim_worklog(self, issue_key, time_seconds, work_date, work_start) -> bool:
+        """
+        Record a worklog as posted in the current worklog_run(); returns False if an identical one already was.
+        """
+        posted = _posted_worklogs.get()
+        key = (issue_key, work_date, work_start, time_seconds)
+        with _posted_worklogs_lock:
+            if key in posted:
+                return False
+            posted.add(key)
+            return True
+
+    def release_worklog(self, issue_key, time_seconds, work_date, work_start):
+        """
+        Forget a claimed worklog whose POST failed, so a later retry in the same run is not skipped.
+        """
+        posted = _posted_worklogs.get()
+        with _posted_worklogs_lock:
+            posted.discard((issue_key, work_date, work_start, time_seconds))
 
     def post_worklog(self, issue_key, issue_id, time_seconds, work_date, work_start, description, account_id) -> str:
+        if not self.claim_worklog(issue_key, time_seconds, work_date, work_start):
+            return f"Skipped duplicate worklog for {issue_key} on {work_date} at {work_start}"
         tempo_url = "https://api.tempo.io/4/worklogs"
         payload = {
             "issueKey": issue_key,
@@ -296,20 +502,123 @@ class LogTimeToTempoTool(BaseTool):
             "description": description,
             "authorAccountId": account_id
         }
-        response = requests.post(
-            tempo_url,
-            headers={
-                "Authorization": f"Bearer {self.tempo_token}",
-                "Content-Type": "application/json"
-            },
-            json=payload
-        )
+        try:
+            response = self._session.post(
+                tempo_url,
+                headers={
+                    "Authorization": f"Bearer {self.tempo_token}",
+                    "Content-Type": "application/json",
+                    # One key per logical request; urllib3 resends the same headers on every retry
+                    "Idempotency-Key": str(uuid.uuid4())
+                },
+                data=orjson.dumps(payload)
+            )
+        except Exception:
+            self.release_worklog(issue_key, time_seconds, work_date, work_start)
+            raise
         if response.status_code in [200, 201]:
-            return f"Logged {time_seconds // 3600}h to {issue_key}"
+            return f"Logged {round(time_seconds / 3600, 2)}h to {issue_key} at {work_start}"
         else:
+            self.release_worklog(issue_key, time_seconds, work_date, work_start)
             return f"Failed for {issue_key}: {response.text}"
 
 
+class WorklogEntry(BaseModel):
+    """
+    A single worklog in a BulkLogTimeToTempoTool call.
+    """
+    issue_key: str = Field("MGAP-X", description="JIRA issue key, e.g. ABC-123; MGAP-X splits the time across all in-progress issues")
+    time_seconds: int = Field(..., description="Number of seconds to log")
+    work_date: Optional[str] = Field(None, description="Date to log in YYYY-MM-DD format")
+    date_range: Optional[str] = Field(None, description="Natural language date range (e.g., 'last week', 'this week'), logged on every weekday in it")
+    work_start: str = Field("09:00:00", description="Start time in HH:MM:SS format")
+    description: str = Field("Work log entry", description="Description or comment for the worklog entry")
+
+
+class BulkWorklogInput(BaseModel):
+    """
+    Input schema for BulkLogTimeToTempoTool.
+    """
+    entries: List[WorklogEntry] = Field(..., description="Every worklog to create, across all days and issues")
+
+
+class BulkLogTimeToTempoTool(BaseTool):
+    """
+    Batch variant of LogTimeToTempoTool that logs many worklogs in a single tool call.
+
+    Letting the LLM send every day and issue at once replaces one model round-trip
+    per worklog with a single call. Entries are logged concurrently through the wrapped
+    LogTimeToTempoTool, sharing its HTTP session, cached account ID and worklog helpers.
+    An entry with issue key "MGAP-X" is split across all in-progress issues for its date,
+    and an entry with a date_range is logged on every date in it.
+
+    Attributes:
+        tempo_tool (LogTimeToTempoTool): The single-worklog tool whose helpers do the logging.
+
+    Args for _run():
+        entries (List[WorklogEntry]): Worklogs to create.
+
+    Returns:
+        str: One result line per entry, in the order the entries were given. An entry that fails
+            reports its own error line without affecting the others.
+    """
+    name: str = "bulk_log_time_to_tempo"
+    description: str = (
+        "Log several worklogs to Tempo Timesheets in one call. "
+        "Use this when logging across multiple days or issues."
+    )
+    args_schema: Type[BaseModel] = BulkWorklogInput
+    tempo_tool: LogTimeToTempoTool = Field(..., description="Tool used to log each entry")
+
+    def _run(
+        self,
+        entries: List[WorklogEntry],
+        run_manager: Optional[CallbackManagerForToolRun] = None
+    ) -> str:
+        if not entries:
+            return "No worklog entries provided."
+
+        # Track duplicates for this call, unless an enclosing worklog_run() already covers the invocation
+        with worklog_run():
+            try:
+                entries = [WorklogEntry.model_validate(entry) for entry in entries]
+                account_id = self.tempo_tool.get_account_id()
+
+                # Search for in-progress issues once, shared by every auto-mode entry
+                issues, truncated = None, False
+                if any(entry.issue_key == "MGAP-X" for entry in entries):
+                    issues, truncated = self.tempo_tool.fetch_in_progress_issues()
+
+                # Auto-mode entries fan out per issue too, so the entry pool shares the date-level limit
+                with ThreadPoolExecutor(max_workers=min(len(entries), MAX_DATE_WORKERS)) as ex:
+                    futures = [ex.submit(copy_context().run, self.log_entry, entry, account_id, issues)
+                               for entry in entries]
+                    results = [future.result() for future in futures]
+
+                if truncated:
+                    results.append(TRUNCATED_NOTE)
+                return "\n".join(results)
+
+            except Exception as e:
+                return f"Exception occurred: {str(e)}"
+
+    def log_entry(self, entry: WorklogEntry, account_id: str, issues: Optional[List[dict]] = None) -> str:
+        # Report failures per entry: the other entries may already be logged, and a batch-wide
+        # error would make the LLM resend (and so duplicate) the whole batch
+        try:
+            results = []
+            # Dates within one entry are logged in turn; the entries themselves already run concurrently
+            for date in self.tempo_tool.resolve_dates(entry.work_date, entry.date_range):
+                if entry.issue_key != "MGAP-X":
+                    result = self.tempo_tool.log_manual(entry.issue_key, entry.time_seconds, date, account_id, entry.work_start, entry.description)
+                else:
+                    result = self.tempo_tool.log_auto_for_date(date, account_id, entry.time_seconds / 3600, entry.work_start, entry.description, issues)
+                results.append(f"{date} {entry.issue_key}: {result}")
+            return "\n".join(results)
+        except Exception as e:
+            return f"{entry.work_date or entry.date_range} {entry.issue_key}: Exception occurred: {str(e)}"
+
+
 # In[ ]:
 
 